@@ -441,15 +441,26 @@ class BasicStructure(ComplexDop):
         else:
             return []
 
-    def print_message_format(self, indent: int = 5, allow_unknown_lengths: bool = False) -> None:
+    def format_message_format(self, indent: int = 5, allow_unknown_lengths: bool = False) -> str:
         """
-        Print a description of the message format to `stdout`.
+        Return a description of the message format as a string.
         """
 
+        result: List[str] = []
         message_as_lines = self._message_format_lines(allow_unknown_lengths=allow_unknown_lengths)
         if message_as_lines is not None:
-            print(f"{indent * ' '}" + f"\n{indent * ' '}".join(message_as_lines))
+            result.append(f"{indent * ' '}" + f"\n{indent * ' '}".join(message_as_lines))
         else:
-            print("Sorry, couldn't pretty print message layout. :(")
+            result.append("Sorry, couldn't pretty print message layout. :(")
         for p in self.parameters:
-            print(indent * " " + str(p).replace("\n", f"\n{indent * ' '}"))
+            result.append(indent * " " + str(p).replace("\n", f"\n{indent * ' '}"))
+
+        return "\n".join(result)
+
+    def print_message_format(self, indent: int = 5, allow_unknown_lengths: bool = False) -> None:
+        """
+        Print a description of the message format to `stdout`.
+        """
+
+        print(
+            self.format_message_format(indent=indent, allow_unknown_lengths=allow_unknown_lengths))
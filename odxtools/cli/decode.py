@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: MIT
 import argparse
 import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from ..database import Database
@@ -14,11 +16,19 @@ from . import _parser_utils
 _odxtools_tool_name_ = "decode"
 
 
+# parameters of decoded messages often exhibit the same values (flags,
+# enumeration values, ...). note that `typed=True` is required to
+# distinguish `True` from `1`.
+@lru_cache(maxsize=4096, typed=True)
+def _format_int(v: int) -> str:
+    return f"{v} (0x{v:x})"
+
+
 def get_display_value(v: ParameterValue) -> str:
     if isinstance(v, bytes):
         return v.hex(" ")
     elif isinstance(v, int):
-        return f"{v} (0x{v:x})"
+        return _format_int(v)
     else:
         return str(v)
 
@@ -31,7 +41,7 @@ def print_summary(
 ) -> None:
     ecu_names = ecu_variants if ecu_variants else [ecu.short_name for ecu in odxdb.ecus]
     service_db: Dict[str, DiagService] = {}
-    service_ecus: Dict[str, List[str]] = {}
+    service_ecus: Dict[str, List[str]] = defaultdict(list)
     for ecu_name in ecu_names:
         ecu = odxdb.ecus[ecu_name]
         if not ecu:
@@ -40,9 +50,7 @@ def print_summary(
         if data:
             found_services = ecu._find_services_for_uds(data)
             for found_service in found_services:
-                ecu_names = service_ecus.get(found_service.short_name, [])
-                ecu_names.append(ecu_name)
-                service_ecus[found_service.short_name] = ecu_names
+                service_ecus[found_service.short_name].append(ecu_name)
                 service_db[found_service.short_name] = found_service
 
     print(f"Binary data: {data.hex(' ')}")
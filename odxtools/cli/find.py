@@ -28,43 +28,50 @@ def print_summary(odxdb: Database,
                   allow_unknown_bit_lengths: bool = False,
                   print_params: bool = False) -> None:
     ecu_names = ecu_variants if ecu_variants else [ecu.short_name for ecu in odxdb.ecus]
-    service_db: Dict[str, DiagService] = {}
+    # the short names of the services which have already been printed
+    # mapped to the names of the ECUs that feature them. The details
+    # of a service are printed as soon as it is first encountered.
     service_ecus: Dict[str, List[str]] = {}
+    search_names_lower = [x.lower() for x in service_names] if service_names else []
     for ecu_name in ecu_names:
         ecu = odxdb.ecus[ecu_name]
         if not ecu:
             print(f"The ecu variant '{ecu_name}' could not be found!")
             continue
 
-        if service_names:
-            for service_name_search in service_names:
-                for service in ecu.services:
-                    if service_name_search.lower() in service.short_name.lower():
-                        ecu_names = service_ecus.get(service.short_name, [])
-                        ecu_names.append(ecu_name)
-                        service_ecus[service.short_name] = ecu_names
-                        service_db[service.short_name] = service
-
-    for service_name, ecu_names in service_ecus.items():
-        service = service_db[service_name]
-        display_names = ", ".join(ecu_names)
-        filler = str.ljust("", len(display_names), "=")
-        print(f"\n{filler}")
-        print(f"{', '.join(ecu_names)}")
-        print(f"{filler}\n\n")
-        if isinstance(service, DiagService):
-            print_diagnostic_service(
-                service,
-                print_params=print_params,
-                allow_unknown_bit_lengths=allow_unknown_bit_lengths,
-                print_pre_condition_states=True,
-                print_state_transitions=True,
-                print_audiences=True,
-            )
-        elif isinstance(service, SingleEcuJob):
-            print(f"SingleEcuJob: {service.odx_id}")
-        else:
-            print(f"Unknown service: {service}")
+        for search_name_lower in search_names_lower:
+            for service_name_lower, service in ecu._services_lower:
+                if search_name_lower not in service_name_lower:
+                    continue
+
+                if (found_ecus := service_ecus.get(service.short_name)) is not None:
+                    if ecu_name not in found_ecus:
+                        found_ecus.append(ecu_name)
+                    continue
+
+                service_ecus[service.short_name] = [ecu_name]
+                filler = "=" * len(ecu_name)
+                print(f"\n{filler}")
+                print(ecu_name)
+                print(f"{filler}\n\n")
+                if isinstance(service, DiagService):
+                    print_diagnostic_service(
+                        service,
+                        print_params=print_params,
+                        allow_unknown_bit_lengths=allow_unknown_bit_lengths,
+                        print_pre_condition_states=True,
+                        print_state_transitions=True,
+                        print_audiences=True,
+                    )
+                elif isinstance(service, SingleEcuJob):
+                    print(f"SingleEcuJob: {service.odx_id}")
+                else:
+                    print(f"Unknown service: {service}")
+
+    if service_ecus:
+        print(f"\nECU variants featuring the matching services:")
+        for service_name, found_ecus in service_ecus.items():
+            print(f" {service_name}: {', '.join(found_ecus)}")
 
 
 def add_subparser(subparsers: "argparse._SubParsersAction") -> None:
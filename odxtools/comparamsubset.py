@@ -24,6 +24,20 @@ if TYPE_CHECKING:
 
 @dataclass
 class ComparamSubset(IdentifiableElement):
+    # this tuple must list exactly the fields of the dataclass which
+    # are not inherited. (`dataclass(slots=True)` is not available
+    # for python 3.8.)
+    __slots__ = (
+        "category",
+        "data_object_props",
+        "comparams",
+        "complex_comparams",
+        "unit_spec",
+        "admin_data",
+        "company_datas",
+        "sdgs",
+    )
+
     # mandatory in ODX 2.2, but non existent in ODX 2.0
     category: Optional[str]
     data_object_props: NamedItemList[DataObjectProperty]
@@ -47,16 +61,26 @@ class ComparamSubset(IdentifiableElement):
         admin_data = AdminData.from_et(et_element.find("ADMIN-DATA"), doc_frags)
         company_datas = create_company_datas_from_et(et_element.find("COMPANY-DATAS"), doc_frags)
 
-        data_object_props = NamedItemList([
-            DataObjectProperty.from_et(el, doc_frags)
-            for el in et_element.iterfind("DATA-OBJECT-PROPS/DATA-OBJECT-PROP")
-        ])
-        comparams = NamedItemList(
-            [Comparam.from_et(el, doc_frags) for el in et_element.iterfind("COMPARAMS/COMPARAM")])
-        complex_comparams = NamedItemList([
-            ComplexComparam.from_et(el, doc_frags)
-            for el in et_element.iterfind("COMPLEX-COMPARAMS/COMPLEX-COMPARAM")
-        ])
+        # subsets may contain thousands of these objects, so we
+        # iterate over the children of the container elements directly
+        # instead of using path expressions and feed the results to
+        # the NamedItemList without an intermediate list
+        data_object_props: NamedItemList[DataObjectProperty] = NamedItemList()
+        if (dops_elem := et_element.find("DATA-OBJECT-PROPS")) is not None:
+            data_object_props = NamedItemList(
+                DataObjectProperty.from_et(el, doc_frags)
+                for el in dops_elem
+                if el.tag == "DATA-OBJECT-PROP")
+        comparams: NamedItemList[Comparam] = NamedItemList()
+        if (comparams_elem := et_element.find("COMPARAMS")) is not None:
+            comparams = NamedItemList(
+                Comparam.from_et(el, doc_frags) for el in comparams_elem if el.tag == "COMPARAM")
+        complex_comparams: NamedItemList[ComplexComparam] = NamedItemList()
+        if (complex_comparams_elem := et_element.find("COMPLEX-COMPARAMS")) is not None:
+            complex_comparams = NamedItemList(
+                ComplexComparam.from_et(el, doc_frags)
+                for el in complex_comparams_elem
+                if el.tag == "COMPLEX-COMPARAM")
         if unit_spec_elem := et_element.find("UNIT-SPEC"):
             unit_spec = UnitSpec.from_et(unit_spec_elem, doc_frags)
         else:
@@ -95,9 +119,8 @@ class ComparamSubset(IdentifiableElement):
         if self.admin_data is not None:
             odxlinks.update(self.admin_data._build_odxlinks())
 
-        if self.company_datas is not None:
-            for cd in self.company_datas:
-                odxlinks.update(cd._build_odxlinks())
+        for cd in self.company_datas:
+            odxlinks.update(cd._build_odxlinks())
 
         for sdg in self.sdgs:
             odxlinks.update(sdg._build_odxlinks())
@@ -120,9 +143,8 @@ class ComparamSubset(IdentifiableElement):
         if self.admin_data is not None:
             self.admin_data._resolve_odxlinks(odxlinks)
 
-        if self.company_datas is not None:
-            for cd in self.company_datas:
-                cd._resolve_odxlinks(odxlinks)
+        for cd in self.company_datas:
+            cd._resolve_odxlinks(odxlinks)
 
         for sdg in self.sdgs:
             sdg._resolve_odxlinks(odxlinks)
@@ -143,9 +165,8 @@ class ComparamSubset(IdentifiableElement):
         if self.admin_data is not None:
             self.admin_data._resolve_snrefs(diag_layer)
 
-        if self.company_datas is not None:
-            for cd in self.company_datas:
-                cd._resolve_snrefs(diag_layer)
+        for cd in self.company_datas:
+            cd._resolve_snrefs(diag_layer)
 
         for sdg in self.sdgs:
             sdg._resolve_snrefs(diag_layer)
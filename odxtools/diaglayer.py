@@ -227,6 +227,14 @@ class DiagLayer:
     def service_groups(self) -> ServiceBinner:
         return ServiceBinner(self.services)
 
+    @cached_property
+    def _services_lower(self) -> List[Tuple[str, DiagService]]:
+        """The services of the layer paired with their lower-case short name
+
+        This is used for case-insensitive searches by service name.
+        """
+        return [(service.short_name.lower(), service) for service in self.services]
+
     #####
     # </convenience functionality>
     #####
@@ -933,6 +941,11 @@ class DiagLayer:
             cast(List[DiagService], sub_tree[-1]).append(service)
 
     def _find_services_for_uds(self, message: bytes) -> List[DiagService]:
+        """Return the services whose coded constant prefix matches the message
+
+        The prefix tree is only constructed for the first lookup, so
+        subsequent lookups merely walk it.
+        """
         prefix_tree = self._prefix_tree
 
         # Find matching service(s) in prefix tree
@@ -9,6 +9,12 @@ from .utils import create_description_from_et, dataclass_fields_asdict
 
 @dataclass
 class NamedElement:
+    # derived classes which do not define `__slots__` themselves
+    # still get a `__dict__`, so this only takes effect for classes
+    # that opt in. Note that slotted fields cannot have default
+    # values.
+    __slots__ = ("short_name", "long_name", "description")
+
     short_name: str
     long_name: Optional[str]
     description: Optional[str]
@@ -28,6 +34,8 @@ class NamedElement:
 
 @dataclass
 class IdentifiableElement(NamedElement):
+    __slots__ = ("odx_id",)
+
     odx_id: OdxLinkId
 
     @staticmethod
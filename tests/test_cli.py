@@ -1,12 +1,17 @@
 # SPDX-License-Identifier: MIT
 
+import re
 import unittest
 from argparse import Namespace
+from contextlib import redirect_stdout
+from io import StringIO
 from typing import List, Optional
+from unittest.mock import patch
 
 import odxtools.cli.decode as decode
 import odxtools.cli.find as find
 import odxtools.cli.list as list_tool
+from odxtools.cli._print_utils import format_desc
 
 import_failed = False
 
@@ -91,11 +96,44 @@ class TestCommandLineTools(unittest.TestCase):
         UtilFunctions.run_find_tool(
             service_names=["headstand"], allow_unknown_bit_lengths=True, no_details=True)
 
+    def test_find_tool_output(self) -> None:
+        for service_names in (["session_start"], ["session_start", "SESSION_ST"]):
+            output = StringIO()
+            with redirect_stdout(output):
+                UtilFunctions.run_find_tool(service_names=service_names)
+            lines = output.getvalue().splitlines()
+
+            # the details of the service are printed once, even though
+            # it is featured by multiple ECUs and matched by multiple
+            # search terms
+            self.assertEqual(sum(line.startswith(" session_start <ID:") for line in lines), 1)
+            self.assertIn(" session_start: somersault_lazy, somersault_assiduous", lines)
+
     @unittest.skipIf(import_failed, "import of PyInquirer failed")
     def test_browse_tool(self) -> None:
         browse_args = Namespace(pdx_file="./examples/somersault.pdx")
         browse.run(browse_args)
 
 
+class TestPrintUtils(unittest.TestCase):
+
+    def test_format_desc(self) -> None:
+        descs = [
+            "  A  plain\n description. ",
+            "Reset the ECU (0x11) - see chapter 1. [#2]",
+            "*very* important_parameter",
+            "Tom &amp; Jerry",
+            "<p>First paragraph</p>\n\n<p>Second <b>paragraph</b></p>",
+        ]
+        for desc in descs:
+            # the fast path for plain text must produce the same
+            # result as unconditionally running markdownify
+            with patch("odxtools.cli._print_utils._MARKUP_CHARS_RE", re.compile("")):
+                expected = format_desc(desc, ident=3)
+            self.assertEqual(format_desc(desc, ident=3), expected)
+
+        self.assertEqual(format_desc("  A  plain\n description. "), "A plain description.")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: MIT
 import unittest
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 import odxtools
+from odxtools.comparamsubset import ComparamSubset
+from odxtools.element import IdentifiableElement
 from odxtools.exceptions import OdxError
 from odxtools.load_pdx_file import load_pdx_file
 from odxtools.nameditemlist import NamedItemList
@@ -151,6 +153,18 @@ class TestNamedItemList(unittest.TestCase):
         self.assertEqual(len(foo.values()), len(foo))
 
 
+class TestComparamSubset(unittest.TestCase):
+
+    def test_slots(self) -> None:
+        # comparam subsets must not carry a per-instance dictionary
+        self.assertFalse(hasattr(odxdb.comparam_subsets[0], "__dict__"))
+
+        # the hand-written slots must match the non-inherited fields
+        inherited_fields = {f.name for f in fields(IdentifiableElement)}
+        own_fields = [f.name for f in fields(ComparamSubset) if f.name not in inherited_fields]
+        self.assertEqual(list(ComparamSubset.__slots__), own_fields)
+
+
 class TestNavigation(unittest.TestCase):
 
     def test_find_ecu_by_name(self) -> None: